@@ -2,8 +2,28 @@
 Gemini Prompt Schema - A modular package for managing structured prompts with Google's Gemini API
 """
 
-from .schema_manager import SchemaManager
-from .models import PromptSchema, PromptResponse
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import PromptResponse, PromptSchema
+    from .schema_manager import SchemaManager
 
 __version__ = "0.1.0"
 __all__ = ["SchemaManager", "PromptSchema", "PromptResponse"]
+
+# Public names are imported on first access so that importing the package
+# does not build the Pydantic core schemas up front
+_LAZY_IMPORTS = {
+    "SchemaManager": ".schema_manager",
+    "PromptSchema": ".models",
+    "PromptResponse": ".models",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,10 +7,11 @@ import re
 from typing import Any, Dict, List, Optional
 from urllib.parse import parse_qs, urlparse
 
-from sqlalchemy import MetaData, create_engine, text
+import orjson
+from sqlalchemy import MetaData, create_engine, insert, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session, selectinload, sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
 from sqlalchemy_utils import JSONType, create_database, database_exists
 
 from .models import Base, PromptResponseDB, PromptSchemaDB
@@ -18,6 +19,21 @@ from .models import Base, PromptResponseDB, PromptSchemaDB
 metadata = MetaData()
 
 
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson, stringifying non-str keys like json.dumps"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _column_values(model: Base) -> Dict[str, Any]:
+    """Column values set on a model instance, leaving unset ones to column defaults"""
+    values = {}
+    for column in model.__table__.columns:
+        value = getattr(model, column.key)
+        if value is not None:
+            values[column.key] = value
+    return values
+
+
 async def create_tables(engine):
     """Create database tables"""
     async with engine.begin() as conn:
@@ -57,7 +73,12 @@ class Database:
                 query_string = "&".join(f"{k}={v[0]}" for k, v in query_params.items())
                 self.url = f"{self.url}?{query_string}"
 
-        self.engine = create_async_engine(self.url, echo=True)
+        self.engine = create_async_engine(
+            self.url,
+            echo=True,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
+        )
         self.async_session = sessionmaker(
             bind=self.engine, class_=AsyncSession, expire_on_commit=False
         )
@@ -98,6 +119,30 @@ class Database:
             result = await session.get(PromptSchemaDB, prompt_id)
             return result
 
+    async def get_schemas(self, prompt_ids: List[str]) -> List[PromptSchemaDB]:
+        """Get several prompt schemas by ID in a single query"""
+        if not prompt_ids:
+            return []
+        async with self.async_session() as session:
+            result = await session.scalars(
+                select(PromptSchemaDB).where(PromptSchemaDB.prompt_id.in_(prompt_ids))
+            )
+            return list(result)
+
+    async def list_schemas(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """List prompt schemas as plain dicts using Core, bypassing the ORM"""
+        table = PromptSchemaDB.__table__
+        stmt = select(table)
+        for name, value in (filters or {}).items():
+            if name not in table.c:
+                raise ValueError(f"Unknown column: {name}")
+            stmt = stmt.where(table.c[name] == value)
+        async with self.engine.connect() as conn:
+            result = await conn.execute(stmt)
+            return [dict(row) for row in result.mappings()]
+
     async def create_schema(self, schema: PromptSchemaDB) -> PromptSchemaDB:
         """Create a new prompt schema"""
         async with self.async_session() as session:
@@ -106,6 +151,38 @@ class Database:
             await session.refresh(schema)
             return schema
 
+    async def create_schemas(
+        self, schemas: List[PromptSchemaDB]
+    ) -> List[PromptSchemaDB]:
+        """
+        Create several prompt schemas with a single INSERT ... RETURNING
+
+        Dialects without executemany RETURNING (SQLite before 3.35) run the
+        INSERT and then a SELECT in the same transaction.
+        """
+        if not schemas:
+            return []
+        values = [_column_values(schema) for schema in schemas]
+        async with self.async_session() as session:
+            if self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+                result = await session.scalars(
+                    insert(PromptSchemaDB).returning(
+                        PromptSchemaDB, sort_by_parameter_order=True
+                    ),
+                    values,
+                )
+                created = list(result)
+            else:
+                await session.execute(insert(PromptSchemaDB), values)
+                prompt_ids = [value["prompt_id"] for value in values]
+                result = await session.scalars(
+                    select(PromptSchemaDB).where(PromptSchemaDB.prompt_id.in_(prompt_ids))
+                )
+                by_id = {schema.prompt_id: schema for schema in result}
+                created = [by_id[prompt_id] for prompt_id in prompt_ids]
+            await session.commit()
+            return created
+
     async def update_schema(self, schema: PromptSchemaDB) -> PromptSchemaDB:
         """Update an existing prompt schema"""
         async with self.async_session() as session:
@@ -114,6 +191,66 @@ class Database:
             await session.refresh(result)
             return result
 
+    async def patch_schema(
+        self, prompt_id: str, updates: Dict[str, Any]
+    ) -> Optional[PromptSchemaDB]:
+        """
+        Apply a partial update with a single UPDATE ... RETURNING
+
+        Dialects without UPDATE ... RETURNING (SQLite before 3.35) run the
+        UPDATE and then a SELECT in the same transaction.
+        """
+        stmt = (
+            update(PromptSchemaDB)
+            .where(PromptSchemaDB.prompt_id == prompt_id)
+            .values(**updates)
+        )
+        async with self.async_session() as session:
+            if self.engine.dialect.update_returning:
+                result = await session.scalars(stmt.returning(PromptSchemaDB))
+            else:
+                await session.execute(
+                    stmt, execution_options={"synchronize_session": False}
+                )
+                result = await session.scalars(
+                    select(PromptSchemaDB).where(PromptSchemaDB.prompt_id == prompt_id)
+                )
+            schema = result.one_or_none()
+            await session.commit()
+            return schema
+
+    async def update_schemas(
+        self, mappings: List[Dict[str, Any]]
+    ) -> List[PromptSchemaDB]:
+        """
+        Apply partial updates keyed by prompt_id with a single bulk UPDATE
+
+        Raises StaleDataError, without committing, if any prompt_id does not
+        exist. Dialects without sane executemany rowcounts (asyncpg) would not
+        raise it themselves, so the selected rows are checked here.
+        """
+        if not mappings:
+            return []
+        prompt_ids = [mapping["prompt_id"] for mapping in mappings]
+        async with self.async_session() as session:
+            await session.execute(
+                update(PromptSchemaDB),
+                mappings,
+                execution_options={"synchronize_session": False},
+            )
+            result = await session.scalars(
+                select(PromptSchemaDB).where(PromptSchemaDB.prompt_id.in_(prompt_ids))
+            )
+            updated = list(result)
+            missing = set(prompt_ids) - {schema.prompt_id for schema in updated}
+            if missing:
+                await session.rollback()
+                raise StaleDataError(
+                    f"No prompt schema for id(s): {', '.join(sorted(missing))}"
+                )
+            await session.commit()
+            return updated
+
     async def delete_schema(self, prompt_id: str) -> bool:
         """Delete a prompt schema"""
         async with self.async_session() as session:
@@ -130,6 +267,20 @@ class Database:
             result = await session.get(PromptResponseDB, response_id)
             return result
 
+    async def get_responses_with_schema(
+        self, prompt_ids: List[str]
+    ) -> List[PromptResponseDB]:
+        """Get the responses for several prompts with their schemas eagerly loaded"""
+        if not prompt_ids:
+            return []
+        async with self.async_session() as session:
+            result = await session.scalars(
+                select(PromptResponseDB)
+                .options(selectinload(PromptResponseDB.schema))
+                .where(PromptResponseDB.prompt_id.in_(prompt_ids))
+            )
+            return list(result)
+
     async def create_response(self, response: PromptResponseDB) -> PromptResponseDB:
         """Create new prompt response"""
         async with self.async_session() as session:
@@ -0,0 +1,56 @@
+"""
+Pydantic, SQLAlchemy and msgspec models for prompt schemas and responses
+
+Each group of models lives in its own submodule, imported on first attribute
+access so that callers needing only one of them do not pay for the others.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._msgspec import PromptResponseFast, PromptSchemaFast
+    from ._pydantic import (
+        _PROMPT_RESPONSE_CORE_SCHEMA,
+        _PROMPT_RESPONSE_SERIALIZER,
+        _PROMPT_RESPONSE_VALIDATOR,
+        _PROMPT_SCHEMA_CORE_SCHEMA,
+        _PROMPT_SCHEMA_SERIALIZER,
+        _PROMPT_SCHEMA_VALIDATOR,
+        _VALIDATOR_CACHE,
+        PromptResponse,
+        PromptSchema,
+        PromptSchemaUpdate,
+        hash_response_schema,
+    )
+    from ._sqlalchemy import Base, PromptResponseDB, PromptSchemaDB
+
+_PYDANTIC = (
+    "PromptSchema",
+    "PromptSchemaUpdate",
+    "PromptResponse",
+    "hash_response_schema",
+    "_VALIDATOR_CACHE",
+    "_PROMPT_SCHEMA_CORE_SCHEMA",
+    "_PROMPT_SCHEMA_VALIDATOR",
+    "_PROMPT_SCHEMA_SERIALIZER",
+    "_PROMPT_RESPONSE_CORE_SCHEMA",
+    "_PROMPT_RESPONSE_VALIDATOR",
+    "_PROMPT_RESPONSE_SERIALIZER",
+)
+_SQLALCHEMY = ("Base", "PromptSchemaDB", "PromptResponseDB")
+_MSGSPEC = ("PromptSchemaFast", "PromptResponseFast")
+
+_LAZY_IMPORTS = {
+    **{name: "._pydantic" for name in _PYDANTIC},
+    **{name: "._sqlalchemy" for name in _SQLALCHEMY},
+    **{name: "._msgspec" for name in _MSGSPEC},
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
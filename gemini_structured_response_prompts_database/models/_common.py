@@ -0,0 +1,9 @@
+"""
+Helpers shared by the model modules
+"""
+
+import time
+
+def _now() -> int:
+    """Current Unix timestamp in whole seconds"""
+    return int(time.time())
@@ -0,0 +1,34 @@
+"""
+msgspec Structs mirroring the database rows for internal read paths
+"""
+
+from typing import Any, Dict, List, Optional
+import msgspec
+
+class PromptSchemaFast(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """msgspec mirror of PromptSchema used on internal read paths"""
+    prompt_id: str
+    prompt_title: str
+    prompt_description: Optional[str] = None
+    prompt_categories: Optional[List[str]] = None
+    main_prompt: str
+    model_instruction: Optional[str] = None
+    additional_messages: Optional[List[Dict[str, str]]] = None
+    response_schema: Dict[str, Any]
+    is_public: bool = False
+    ranking: float = 0.0
+    last_used: Optional[int] = None
+    usage_count: int = 0
+    created_at: int
+    created_by: Optional[str] = None
+    last_updated: Optional[int] = None
+    last_updated_by: Optional[str] = None
+    provider_configs: Optional[Dict[str, Any]] = None
+    schema_hash: Optional[str] = None
+
+class PromptResponseFast(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """msgspec mirror of PromptResponse used on internal read paths"""
+    response_id: str
+    prompt_id: str
+    raw_response: Dict[str, Any]
+    created_at: int
@@ -0,0 +1,277 @@
+"""
+Pydantic models for schema validation
+"""
+
+import hashlib
+import json
+import re
+from typing import TYPE_CHECKING, Annotated, Dict, List, Optional, Tuple, Any
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    SkipValidation,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+
+from ._common import _now
+
+# jsonschema is only needed once a schema is compiled, so it is imported there
+if TYPE_CHECKING:
+    from jsonschema import Draft7Validator
+
+# Slug-style identifiers; UUIDs also match
+_PROMPT_ID_RE = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+def _check_prompt_id(value: str) -> str:
+    """Reject prompt IDs that are not 1-64 characters of letters, digits, '_' or '-'"""
+    if not _PROMPT_ID_RE.fullmatch(value):
+        raise ValueError("prompt_id must be 1-64 characters of letters, digits, '_' or '-'")
+    return value
+
+def _check_keys(value: dict) -> None:
+    """JSON object keys must be strings, as the Dict[str, ...] annotations declare"""
+    if not all(isinstance(key, str) for key in value):
+        raise ValueError("JSON object keys must be strings")
+
+def _shallow_json(kind: type, optional: bool = False, items: Optional[type] = None) -> BeforeValidator:
+    """
+    Check only the top level of a JSON field: its type, its keys if it is an
+    object, and the type (and keys) of each item if ``items`` is given.
+    Nested values are not walked.
+    """
+    def check(value):
+        if value is None and optional:
+            return value
+        if not isinstance(value, kind):
+            raise ValueError(f"Input should be a valid {kind.__name__}")
+        if kind is dict:
+            _check_keys(value)
+        if items is not None:
+            for item in value:
+                if not isinstance(item, items):
+                    raise ValueError(f"Each item should be a valid {items.__name__}")
+                if items is dict:
+                    _check_keys(item)
+        return value
+    return BeforeValidator(check)
+
+# JSON column types validated in O(top level) rather than node by node
+_JSONObject = Annotated[SkipValidation[Dict[str, Any]], _shallow_json(dict)]
+_OptionalJSONObject = Annotated[SkipValidation[Optional[Dict[str, Any]]], _shallow_json(dict, optional=True)]
+_MessageList = Annotated[SkipValidation[Optional[List[Dict[str, str]]]], _shallow_json(list, optional=True, items=dict)]
+
+def hash_response_schema(schema: Dict) -> str:
+    """Stable hash of a JSON schema, identical for semantically equal key orders"""
+    return hashlib.blake2b(
+        json.dumps(schema, sort_keys=True, separators=(",", ":")).encode(),
+        digest_size=16,
+    ).hexdigest()
+
+def _derive_schema_hash(schema: Dict) -> str:
+    """hash_response_schema for validators, reporting unhashable schemas as invalid input"""
+    try:
+        return hash_response_schema(schema)
+    except TypeError as e:
+        # e.g. nested keys of mixed types, which cannot be sorted
+        raise ValueError(f"response_schema cannot be hashed: {e}")
+
+# Compiled JSON Schema validators keyed by hash_response_schema
+_VALIDATOR_CACHE: Dict[str, "Draft7Validator"] = {}
+
+class PromptSchema(BaseModel):
+    """Pydantic model for prompt schema validation"""
+    prompt_id: str = Field(..., description="Unique identifier for this prompt")
+    prompt_title: str = Field(..., description="Human-readable title for the prompt", alias="prompt_type")
+    prompt_description: Optional[str] = Field("", description="Detailed description of the prompt's purpose and usage")
+    prompt_categories: List[str] = Field(default_factory=list, description="Categories/tags for organizing prompts")
+    main_prompt: str = Field(..., description="The primary prompt/instruction text", alias="prompt_text")
+    model_instruction: Optional[str] = Field(None, description="Specific instructions for model behavior")
+    additional_messages: _MessageList = Field(
+        default=None,
+        description="Additional context messages in role:content format"
+    )
+    response_schema: _JSONObject = Field(..., description="JSON schema for validating responses")
+    is_public: bool = Field(default=False, description="Whether this prompt is publicly accessible")
+    ranking: float = Field(default=0.0, description="Prompt effectiveness ranking (0-1)")
+    last_used: Optional[int] = Field(None, description="Timestamp of last usage")
+    usage_count: int = Field(default=0, description="Number of times this prompt has been used")
+    created_at: int = Field(default_factory=_now, description="Creation timestamp")
+    created_by: Optional[str] = Field(None, description="User ID of creator")
+    last_updated: Optional[int] = Field(None, description="Last update timestamp", alias="updated_at")
+    last_updated_by: Optional[str] = Field(None, description="User ID of last updater")
+    provider_configs: _OptionalJSONObject = Field(
+        default_factory=dict,
+        description="Provider-specific configurations"
+    )
+    schema_hash: Optional[str] = Field(
+        None,
+        description="Hash of response_schema; computed on validation, supplied values are ignored",
+        validate_default=True,
+    )
+
+    _compiled_validator: Optional["Draft7Validator"] = PrivateAttr(default=None)
+
+    model_config = ConfigDict(
+        populate_by_name=True, from_attributes=True, frozen=True, extra="ignore"
+    )
+
+    validate_prompt_id = field_validator('prompt_id', mode='after')(_check_prompt_id)
+
+    @field_validator('schema_hash', mode='after')
+    @classmethod
+    def compute_schema_hash(cls, v, info: ValidationInfo):
+        """
+        Always derive the hash from response_schema, so a caller cannot pair a
+        schema with another schema's compiled-validator cache key
+        """
+        schema = info.data.get("response_schema")
+        return _derive_schema_hash(schema) if schema is not None else None
+
+    def warm_validator(self) -> "Draft7Validator":
+        """Compile the validator for response_schema now, unless already done"""
+        if self._compiled_validator is None:
+            self._compiled_validator = self._compile_schema(
+                self.response_schema, key=self.schema_hash
+            )
+        return self._compiled_validator
+
+    @property
+    def compiled_validator(self) -> "Draft7Validator":
+        """Validator for response_schema, compiled on first access"""
+        return self.warm_validator()
+
+    def validate_batch(self, items: List[Dict[str, Any]]) -> List[Tuple[int, List[str]]]:
+        """Validate many responses at once, returning (index, errors) for each invalid one"""
+        validator = self.compiled_validator
+        return [
+            (index, [error.message for error in validator.iter_errors(item)])
+            for index, item in enumerate(items)
+            if not validator.is_valid(item)
+        ]
+
+    def record_usage(self, used_at: Optional[int] = None) -> "PromptSchema":
+        """Return a copy with usage_count incremented and last_used set"""
+        return self.model_copy(
+            update={
+                "usage_count": self.usage_count + 1,
+                "last_used": used_at if used_at is not None else _now(),
+            }
+        )
+
+    @staticmethod
+    def _compile_schema(schema: Dict, key: Optional[str] = None) -> "Draft7Validator":
+        """Return the cached validator for a JSON schema, compiling it on first use"""
+        key = key or hash_response_schema(schema)
+        validator = _VALIDATOR_CACHE.get(key)
+        if validator is None:
+            from jsonschema import Draft7Validator
+
+            Draft7Validator.check_schema(schema)
+            validator = _VALIDATOR_CACHE.setdefault(key, Draft7Validator(schema))
+        return validator
+
+class PromptSchemaUpdate(BaseModel):
+    """Pydantic model for partial prompt schema updates; unset fields are left untouched"""
+    prompt_title: Optional[str] = Field(None, description="Human-readable title for the prompt", alias="prompt_type")
+    prompt_description: Optional[str] = Field(None, description="Detailed description of the prompt's purpose and usage")
+    prompt_categories: Optional[List[str]] = Field(None, description="Categories/tags for organizing prompts")
+    main_prompt: Optional[str] = Field(None, description="The primary prompt/instruction text", alias="prompt_text")
+    model_instruction: Optional[str] = Field(None, description="Specific instructions for model behavior")
+    additional_messages: _MessageList = Field(
+        None,
+        description="Additional context messages in role:content format"
+    )
+    response_schema: _OptionalJSONObject = Field(None, description="JSON schema for validating responses")
+    is_public: Optional[bool] = Field(None, description="Whether this prompt is publicly accessible")
+    ranking: Optional[float] = Field(None, description="Prompt effectiveness ranking (0-1)")
+    last_used: Optional[int] = Field(None, description="Timestamp of last usage")
+    usage_count: Optional[int] = Field(None, description="Number of times this prompt has been used")
+    created_at: Optional[int] = Field(None, description="Creation timestamp")
+    created_by: Optional[str] = Field(None, description="User ID of creator")
+    last_updated: Optional[int] = Field(None, description="Last update timestamp", alias="updated_at")
+    last_updated_by: Optional[str] = Field(None, description="User ID of last updater")
+    provider_configs: _OptionalJSONObject = Field(None, description="Provider-specific configurations")
+    schema_hash: Optional[str] = Field(
+        None, description="Hash of response_schema; set with it, supplied values are ignored"
+    )
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    @field_validator(
+        'prompt_title',
+        'main_prompt',
+        'response_schema',
+        'is_public',
+        'ranking',
+        'usage_count',
+        'prompt_categories',
+        'created_at',
+        mode='before',
+    )
+    @classmethod
+    def reject_null(cls, v, info: ValidationInfo):
+        """Fields that are required on PromptSchema may be changed but not cleared"""
+        if v is None:
+            raise ValueError(f"{info.field_name} cannot be null")
+        return v
+
+    @model_validator(mode='after')
+    def derive_schema_hash(self):
+        """schema_hash is only changed, and always derived, when response_schema is"""
+        if "response_schema" in self.model_fields_set:
+            self.schema_hash = _derive_schema_hash(self.response_schema)
+        else:
+            self.schema_hash = None
+            self.__pydantic_fields_set__.discard("schema_hash")
+        return self
+
+class PromptResponse(BaseModel):
+    """Pydantic model for prompt response validation"""
+    response_id: str = Field(..., description="Unique identifier for this response")
+    prompt_id: str = Field(..., description="Reference to the prompt that generated this response")
+    raw_response: Dict[str, Any] = Field(..., description="Raw response data with arbitrary structure")
+    created_at: int = Field(default_factory=_now, description="Response creation timestamp")
+
+    model_config = ConfigDict(from_attributes=True, extra="allow", frozen=True)
+
+    validate_prompt_id = field_validator('prompt_id', mode='after')(_check_prompt_id)
+
+    @field_validator('raw_response', mode='after')
+    @classmethod
+    def validate_against_schema(cls, v, info: ValidationInfo):
+        """
+        Validate the raw_response against the associated PromptSchema, passed as
+        ``context={"prompt_schema": ...}`` to reuse its stored hash and compiled
+        validator, or against a bare ``context={"response_schema": ...}``,
+        which is hashed on every call
+        """
+        context = info.context or {}
+        prompt_schema = context.get("prompt_schema")
+        if prompt_schema is not None:
+            validator = prompt_schema.warm_validator()
+        elif context.get("response_schema") is not None:
+            validator = PromptSchema._compile_schema(context["response_schema"])
+        else:
+            return v
+        from jsonschema import ValidationError as JSONSchemaValidationError
+
+        try:
+            validator.validate(v)
+        except JSONSchemaValidationError as e:
+            raise ValueError(f"Response does not match schema: {e.message}")
+        return v
+
+# Core schemas, validators and serializers are built exactly once, here at
+# import, and shared process-wide; trusted callers can use them directly and
+# skip the model_validate wrapper
+_PROMPT_SCHEMA_CORE_SCHEMA = PromptSchema.__pydantic_core_schema__
+_PROMPT_SCHEMA_VALIDATOR = PromptSchema.__pydantic_validator__
+_PROMPT_SCHEMA_SERIALIZER = PromptSchema.__pydantic_serializer__
+_PROMPT_RESPONSE_CORE_SCHEMA = PromptResponse.__pydantic_core_schema__
+_PROMPT_RESPONSE_VALIDATOR = PromptResponse.__pydantic_validator__
+_PROMPT_RESPONSE_SERIALIZER = PromptResponse.__pydantic_serializer__
@@ -0,0 +1,75 @@
+"""
+SQLAlchemy models for prompt schemas and responses
+"""
+
+import sys
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import String, Integer, Text, Boolean, Float, JSON, ForeignKey, inspect
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+from ._common import _now
+
+class Base(DeclarativeBase):
+    pass
+
+class PromptSchemaDB(Base):
+    """SQLAlchemy model for prompt configuration"""
+    __tablename__ = 'prompt_schemas'
+
+    prompt_id: Mapped[str] = mapped_column(String, primary_key=True)
+    prompt_title: Mapped[str] = mapped_column(String, nullable=False)
+    prompt_description: Mapped[Optional[str]] = mapped_column(Text)
+    prompt_categories: Mapped[Optional[List[str]]] = mapped_column(JSON)
+    main_prompt: Mapped[str] = mapped_column(Text, nullable=False)
+    model_instruction: Mapped[Optional[str]] = mapped_column(Text)
+    additional_messages: Mapped[Optional[List[Dict[str, str]]]] = mapped_column(JSON)
+    response_schema: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    is_public: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    ranking: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    last_used: Mapped[Optional[int]] = mapped_column(Integer)
+    usage_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    created_at: Mapped[int] = mapped_column(Integer, nullable=False, default=_now)
+    created_by: Mapped[Optional[str]] = mapped_column(String)
+    last_updated: Mapped[Optional[int]] = mapped_column(Integer)
+    last_updated_by: Mapped[Optional[str]] = mapped_column(String)
+    provider_configs: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
+    schema_hash: Mapped[Optional[str]] = mapped_column(String(32), index=True)
+
+    # Relationship to responses
+    responses: Mapped[List["PromptResponseDB"]] = relationship(back_populates="schema")
+
+class PromptResponseDB(Base):
+    """SQLAlchemy model for prompt responses"""
+    __tablename__ = 'prompt_responses'
+
+    response_id: Mapped[str] = mapped_column(String, primary_key=True)
+    prompt_id: Mapped[str] = mapped_column(
+        String, ForeignKey("prompt_schemas.prompt_id"), nullable=False
+    )
+    raw_response: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[int] = mapped_column(Integer, nullable=False, default=_now)
+
+    # Relationship to schema, loaded with one extra query per batch of responses
+    schema: Mapped["PromptSchemaDB"] = relationship(back_populates="responses", lazy="selectin")
+
+def _make_fast_constructor(cls: type) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Generate a constructor specialised to the columns of cls that writes values
+    straight into the instance __dict__, skipping the instrumented attribute
+    setters. Only suitable for new, pending instances.
+    """
+    fields = tuple(sys.intern(column.key) for column in cls.__table__.columns)
+    lines = ["def _fast_construct(data):", "    obj = new_instance()", "    values = obj.__dict__"]
+    for field in fields:
+        lines.append(f"    if {field!r} in data:")
+        lines.append(f"        values[{field!r}] = data[{field!r}]")
+    lines.append("    return obj")
+    namespace = {"new_instance": inspect(cls).class_manager.new_instance}
+    exec("\n".join(lines), namespace)
+    return namespace["_fast_construct"]
+
+# new_instance() does not configure mappers the way __init__ does
+Base.registry.configure()
+PromptSchemaDB._fast_construct = staticmethod(_make_fast_constructor(PromptSchemaDB))
+PromptResponseDB._fast_construct = staticmethod(_make_fast_constructor(PromptResponseDB))
+
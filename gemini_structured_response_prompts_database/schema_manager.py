@@ -4,15 +4,30 @@ Core schema management functionality for Gemini prompts
 
 import json
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Union
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import msgspec
+from async_lru import alru_cache
 from fastapi import HTTPException
+from jsonschema.exceptions import SchemaError
 from pydantic import BaseModel, ValidationError
 from sqlalchemy import Table
+from sqlalchemy.orm.exc import StaleDataError
 
 from .database import Database
-from .models import PromptResponse, PromptResponseDB, PromptSchema, PromptSchemaDB
+from .models import (
+    _PROMPT_RESPONSE_VALIDATOR,
+    _PROMPT_SCHEMA_VALIDATOR,
+    PromptResponse,
+    PromptResponseDB,
+    PromptResponseFast,
+    PromptSchema,
+    PromptSchemaDB,
+    PromptSchemaFast,
+    PromptSchemaUpdate,
+    hash_response_schema,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -39,9 +54,22 @@ class SchemaManager:
         default_prompt_type: Optional[str] = None,
         default_prompt_text: Optional[str] = None,
         default_response_schema: Optional[Dict] = None,
+        validate_on_read: bool = False,
     ):
-        """Initialize SchemaManager with optional custom database and defaults"""
+        """Initialize SchemaManager with optional custom database and defaults
+
+        Set ``validate_on_read`` to run full validation on rows loaded from the
+        database, e.g. while migrating data written outside of this manager.
+
+        get_prompt_schema results are cached per manager for up to 60 seconds.
+        Writes made through this manager invalidate its cache; writes made
+        through another manager or directly against the database may be served
+        stale until the entry expires. Cached schemas are shared between
+        callers and must be treated as read-only.
+        """
         self.database = database
+        self._cached_get = alru_cache(maxsize=1024, ttl=60)(self._load_schema)
+        self.validate_on_read = validate_on_read
         self.table = table
         self.default_prompt_type = default_prompt_type or self.DEFAULT_PROMPT_TYPE
         self.default_prompt_text = default_prompt_text or self.DEFAULT_PROMPT_TEXT
@@ -52,42 +80,146 @@ class SchemaManager:
             default_response_schema or self.DEFAULT_RESPONSE_SCHEMA
         )
 
+    @property
+    def validate_on_read(self) -> bool:
+        return self._validate_on_read
+
+    @validate_on_read.setter
+    def validate_on_read(self, value: bool) -> None:
+        # Cached schemas were built under the previous setting
+        self._validate_on_read = value
+        self._cached_get.cache_clear()
+
+    def _db_to_struct(
+        self, db_model: Union[PromptSchemaDB, PromptResponseDB]
+    ) -> Union[PromptSchemaFast, PromptResponseFast]:
+        """Convert SQLAlchemy model to msgspec Struct"""
+        if isinstance(db_model, PromptSchemaDB):
+            return msgspec.convert(db_model, PromptSchemaFast, from_attributes=True)
+        elif isinstance(db_model, PromptResponseDB):
+            return msgspec.convert(db_model, PromptResponseFast, from_attributes=True)
+        raise ValueError(f"Unknown model type: {type(db_model)}")
+
     def _db_to_pydantic(
         self, db_model: Union[PromptSchemaDB, PromptResponseDB]
     ) -> Union[PromptSchema, PromptResponse]:
         """Convert SQLAlchemy model to Pydantic model"""
         if isinstance(db_model, PromptSchemaDB):
-            return PromptSchema.model_validate(db_model)
+            model, validator = PromptSchema, _PROMPT_SCHEMA_VALIDATOR
         elif isinstance(db_model, PromptResponseDB):
-            return PromptResponse.model_validate(db_model)
-        raise ValueError(f"Unknown model type: {type(db_model)}")
+            model, validator = PromptResponse, _PROMPT_RESPONSE_VALIDATOR
+        else:
+            raise ValueError(f"Unknown model type: {type(db_model)}")
+        if self.validate_on_read:
+            return validator.validate_python(
+                db_model, strict=False, from_attributes=True
+            )
+        # Rows were validated on write, so by default they are trusted and the
+        # Pydantic model is built without running validation again
+        return model.model_construct(
+            **{
+                column.key: getattr(db_model, column.key)
+                for column in db_model.__table__.columns
+            }
+        )
 
     def _pydantic_to_db(
         self, pydantic_model: Union[PromptSchema, PromptResponse]
     ) -> Union[PromptSchemaDB, PromptResponseDB]:
         """Convert Pydantic model to SQLAlchemy model"""
-        data = pydantic_model.model_dump()
+        # None values are left off so column defaults apply and merges do not
+        # overwrite stored values with NULL
+        data = {
+            key: value
+            for key, value in pydantic_model.__dict__.items()
+            if value is not None
+        }
         if isinstance(pydantic_model, PromptSchema):
-            return PromptSchemaDB(**data)
+            if "schema_hash" not in data:
+                data["schema_hash"] = hash_response_schema(data["response_schema"])
+            return PromptSchemaDB._fast_construct(data)
         elif isinstance(pydantic_model, PromptResponse):
-            return PromptResponseDB(**data)
+            return PromptResponseDB._fast_construct(data)
         raise ValueError(f"Unknown model type: {type(pydantic_model)}")
 
+    async def _load_schema(self, prompt_id: str) -> PromptSchema:
+        """Load a prompt schema; wrapped per instance as the cached ``_cached_get``"""
+        result = await self.database.get_schema(prompt_id)
+        if not result:
+            raise HTTPException(
+                status_code=404, detail=f"Schema not found for id: {prompt_id}"
+            )
+        return self._db_to_pydantic(result)
+
     async def get_prompt_schema(self, prompt_id: str) -> PromptSchema:
-        """Get a prompt schema by ID"""
+        """
+        Get a prompt schema by ID
+
+        The result is the cached instance shared with every other caller.
+        ``frozen=True`` is shallow, so its dicts and lists (response_schema,
+        prompt_categories, provider_configs, ...) must not be mutated; doing so
+        changes later results and leaves schema_hash and the compiled validator
+        out of step. Use ``model_copy(deep=True)`` to get a copy to edit.
+        """
+        try:
+            return await self._cached_get(prompt_id)
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting schema: {str(e)}")
+            raise HTTPException(
+                status_code=500, detail=f"Failed to get schema: {str(e)}"
+            )
+
+    async def get_prompt_schema_json(self, prompt_id: str) -> bytes:
+        """Get a prompt schema by ID as encoded JSON, ready to return from an API"""
         try:
             result = await self.database.get_schema(prompt_id)
             if not result:
                 raise HTTPException(
                     status_code=404, detail=f"Schema not found for id: {prompt_id}"
                 )
-            return self._db_to_pydantic(result)
+            return msgspec.json.encode(self._db_to_struct(result))
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error getting schema: {str(e)}")
             raise HTTPException(
                 status_code=500, detail=f"Failed to get schema: {str(e)}"
             )
 
+    async def get_prompt_schemas(self, prompt_ids: List[str]) -> List[PromptSchema]:
+        """Get several prompt schemas in one query, skipping IDs that do not exist"""
+        try:
+            results = {
+                result.prompt_id: result
+                for result in await self.database.get_schemas(prompt_ids)
+            }
+            return [
+                self._db_to_pydantic(results[prompt_id])
+                for prompt_id in prompt_ids
+                if prompt_id in results
+            ]
+        except Exception as e:
+            logger.error(f"Error getting schemas: {str(e)}")
+            raise HTTPException(
+                status_code=500, detail=f"Failed to get schemas: {str(e)}"
+            )
+
+    async def list_prompt_schemas_fast(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """List prompt schemas matching column filters as plain dicts for read-only use"""
+        try:
+            return await self.database.list_schemas(filters)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error listing schemas: {str(e)}")
+            raise HTTPException(
+                status_code=500, detail=f"Failed to list schemas: {str(e)}"
+            )
+
     async def create_prompt_schema(
         self,
         prompt_id: str,
@@ -107,13 +239,16 @@ class SchemaManager:
                 response_schema=response_schema,
                 model_instruction=model_instruction,
                 additional_messages=additional_messages,
-                created_at=int(datetime.now().timestamp()),
+                created_at=int(time.time()),
                 **kwargs,
             )
+            # Compile the response validator up front so the first response
+            # validated against this schema does not pay for it
+            schema.warm_validator()
             db_schema = self._pydantic_to_db(schema)
             result = await self.database.create_schema(db_schema)
             return self._db_to_pydantic(result)
-        except ValidationError as e:
+        except (ValidationError, SchemaError) as e:
             raise HTTPException(status_code=422, detail=str(e))
         except Exception as e:
             logger.error(f"Error creating schema: {str(e)}")
@@ -121,6 +256,25 @@ class SchemaManager:
                 status_code=500, detail=f"Failed to create schema: {str(e)}"
             )
 
+    async def bulk_create_prompt_schemas(self, items: List[Dict]) -> List[PromptSchema]:
+        """Create several prompt schemas with a single INSERT"""
+        try:
+            created_at = int(time.time())
+            schemas = [PromptSchema(**{"created_at": created_at, **item}) for item in items]
+            for schema in schemas:
+                schema.warm_validator()
+            results = await self.database.create_schemas(
+                [self._pydantic_to_db(schema) for schema in schemas]
+            )
+            return [self._db_to_pydantic(result) for result in results]
+        except (ValidationError, SchemaError) as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error creating schemas: {str(e)}")
+            raise HTTPException(
+                status_code=500, detail=f"Failed to create schemas: {str(e)}"
+            )
+
     async def update_prompt_schema(
         self,
         prompt_id: str,
@@ -131,38 +285,43 @@ class SchemaManager:
         additional_messages: Optional[List[Dict[str, str]]] = None,
         **kwargs,
     ) -> PromptSchema:
-        """Update an existing prompt schema"""
+        """
+        Update an existing prompt schema
+
+        A named argument left as None keeps the stored value. Any other
+        PromptSchemaUpdate field can be passed as a keyword argument; an
+        explicit None there clears the column, as in bulk_update_prompt_schemas.
+        Unknown fields are rejected with a 422.
+        """
         try:
-            existing = await self.database.get_schema(prompt_id)
-            if not existing:
+            named = {
+                "prompt_type": prompt_title,
+                "prompt_text": prompt_text,
+                "response_schema": response_schema,
+                "model_instruction": model_instruction,
+                "additional_messages": additional_messages,
+            }
+            updates = {key: value for key, value in named.items() if value is not None}
+            changes = PromptSchemaUpdate(**{**updates, **kwargs}).model_dump(
+                mode="python", exclude_unset=True, by_alias=False
+            )
+            if changes.get("response_schema") is not None:
+                PromptSchema._compile_schema(
+                    changes["response_schema"], key=changes["schema_hash"]
+                )
+
+            result = await self.database.patch_schema(
+                prompt_id, {"last_updated": int(time.time()), **changes}
+            )
+            self._cached_get.cache_invalidate(prompt_id)
+            if not result:
                 raise HTTPException(
                     status_code=404, detail=f"Schema not found for id: {prompt_id}"
                 )
-
-            update_data = {
-                "prompt_id": prompt_id,
-                "prompt_type": prompt_title or existing.prompt_title,
-                "prompt_text": prompt_text or existing.main_prompt,
-                "response_schema": response_schema or existing.response_schema,
-                "model_instruction": (
-                    model_instruction
-                    if model_instruction is not None
-                    else existing.model_instruction
-                ),
-                "additional_messages": (
-                    additional_messages
-                    if additional_messages is not None
-                    else existing.additional_messages
-                ),
-                "updated_at": int(datetime.now().timestamp()),
-                **kwargs,
-            }
-
-            schema = PromptSchema(**update_data)
-            db_schema = self._pydantic_to_db(schema)
-            result = await self.database.update_schema(db_schema)
             return self._db_to_pydantic(result)
-        except ValidationError as e:
+        except HTTPException:
+            raise
+        except (ValidationError, SchemaError) as e:
             raise HTTPException(status_code=422, detail=str(e))
         except Exception as e:
             logger.error(f"Error updating schema: {str(e)}")
@@ -170,13 +329,77 @@ class SchemaManager:
                 status_code=500, detail=f"Failed to update schema: {str(e)}"
             )
 
+    async def bulk_update_prompt_schemas(self, items: List[Dict]) -> List[PromptSchema]:
+        """Apply partial updates to several prompt schemas with a single UPDATE"""
+        try:
+            updated_at = int(time.time())
+            mappings = []
+            for item in items:
+                if "prompt_id" not in item:
+                    raise HTTPException(
+                        status_code=422, detail="prompt_id is required for updates"
+                    )
+                changes = PromptSchemaUpdate(
+                    **{key: value for key, value in item.items() if key != "prompt_id"}
+                ).model_dump(
+                    mode="python", exclude_unset=True, by_alias=False
+                )
+                if changes.get("response_schema") is not None:
+                    PromptSchema._compile_schema(
+                        changes["response_schema"], key=changes["schema_hash"]
+                    )
+                mappings.append(
+                    {"prompt_id": item["prompt_id"], "last_updated": updated_at, **changes}
+                )
+            results = {
+                result.prompt_id: result
+                for result in await self.database.update_schemas(mappings)
+            }
+            for mapping in mappings:
+                self._cached_get.cache_invalidate(mapping["prompt_id"])
+            return [
+                self._db_to_pydantic(results[mapping["prompt_id"]])
+                for mapping in mappings
+            ]
+        except HTTPException:
+            raise
+        except StaleDataError as e:
+            raise HTTPException(status_code=404, detail=f"Schema not found: {str(e)}")
+        except (ValidationError, SchemaError) as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error updating schemas: {str(e)}")
+            raise HTTPException(
+                status_code=500, detail=f"Failed to update schemas: {str(e)}"
+            )
+
     async def delete_prompt_schema(self, prompt_id: str) -> bool:
         """Delete a prompt schema"""
         try:
             await self.database.delete_schema(prompt_id)
+            self._cached_get.cache_invalidate(prompt_id)
             return True
         except Exception as e:
             logger.error(f"Error deleting schema: {str(e)}")
             raise HTTPException(
                 status_code=500, detail=f"Failed to delete schema: {str(e)}"
             )
+
+    async def get_responses_with_schema(
+        self, prompt_ids: List[str]
+    ) -> List[Tuple[PromptResponse, PromptSchema]]:
+        """Get the responses for several prompts paired with their schemas"""
+        try:
+            results = await self.database.get_responses_with_schema(prompt_ids)
+            schemas = {}
+            pairs = []
+            for result in results:
+                if result.prompt_id not in schemas:
+                    schemas[result.prompt_id] = self._db_to_pydantic(result.schema)
+                pairs.append((self._db_to_pydantic(result), schemas[result.prompt_id]))
+            return pairs
+        except Exception as e:
+            logger.error(f"Error getting responses: {str(e)}")
+            raise HTTPException(
+                status_code=500, detail=f"Failed to get responses: {str(e)}"
+            )
@@ -13,7 +13,11 @@ setup(
         "sqlalchemy-utils>=0.41.1",
         "asyncpg>=0.29.0",
         "aiosqlite>=0.19.0",
-        "greenlet>=3.0.3"
+        "greenlet>=3.0.3",
+        "jsonschema>=4.0.0",
+        "msgspec>=0.18.0",
+        "orjson>=3.8.0",
+        "async-lru>=2.0.0",
     ],
     python_requires=">=3.9",
 )
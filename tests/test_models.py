@@ -0,0 +1,163 @@
+import os
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gemini_structured_response_prompts_database.models import _pydantic as models_pydantic
+from gemini_structured_response_prompts_database.models import (
+    _VALIDATOR_CACHE,
+    PromptResponse,
+    PromptSchema,
+    PromptSchemaUpdate,
+    hash_response_schema,
+)
+
+RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {"sentiment": {"type": "string"}},
+    "required": ["sentiment"],
+}
+
+
+def test_compile_schema_is_cached_by_canonical_json():
+    validator = PromptSchema._compile_schema(RESPONSE_SCHEMA)
+    reordered = dict(reversed(list(RESPONSE_SCHEMA.items())))
+    assert PromptSchema._compile_schema(reordered) is validator
+    assert validator in _VALIDATOR_CACHE.values()
+
+
+def test_response_validated_against_context_schema():
+    data = {"response_id": "r1", "prompt_id": "p1", "raw_response": {"sentiment": "positive"}}
+    context = {"response_schema": RESPONSE_SCHEMA}
+    assert PromptResponse.model_validate(data, context=context).raw_response == {
+        "sentiment": "positive"
+    }
+
+    with pytest.raises(ValidationError):
+        PromptResponse.model_validate({**data, "raw_response": {}}, context=context)
+
+
+def test_response_validated_against_prompt_schema_without_rehashing(monkeypatch):
+    schema = PromptSchema(
+        prompt_id="p1", prompt_type="T", prompt_text="Hello?", response_schema=RESPONSE_SCHEMA
+    )
+    schema.warm_validator()
+
+    def fail(_schema):
+        raise AssertionError("response_schema was hashed again")
+
+    monkeypatch.setattr(models_pydantic, "hash_response_schema", fail)
+    data = {"response_id": "r1", "prompt_id": "p1", "raw_response": {"sentiment": "positive"}}
+    context = {"prompt_schema": schema}
+    assert PromptResponse.model_validate(data, context=context).raw_response == {
+        "sentiment": "positive"
+    }
+    with pytest.raises(ValidationError):
+        PromptResponse.model_validate({**data, "raw_response": {}}, context=context)
+
+
+def test_response_without_schema_is_not_validated():
+    response = PromptResponse(response_id="r1", prompt_id="p1", raw_response={"any": 1})
+    assert response.raw_response == {"any": 1}
+
+
+def test_prompt_schema_is_frozen():
+    schema = PromptSchema(
+        prompt_id="p1", prompt_type="T", prompt_text="Hello?", response_schema={}
+    )
+    with pytest.raises(ValidationError):
+        schema.usage_count = 5
+
+    used = schema.record_usage(used_at=123)
+    assert (used.usage_count, used.last_used) == (1, 123)
+    assert (schema.usage_count, schema.last_used) == (0, None)
+
+
+def test_compiled_validator_is_shared():
+    schema = PromptSchema(
+        prompt_id="p1", prompt_type="T", prompt_text="Hello?", response_schema=RESPONSE_SCHEMA
+    )
+    assert schema.compiled_validator is PromptSchema._compile_schema(RESPONSE_SCHEMA)
+    assert schema.compiled_validator.is_valid({"sentiment": "neutral"})
+    assert not schema.compiled_validator.is_valid({})
+
+
+def test_validate_batch_reports_invalid_items():
+    schema = PromptSchema(
+        prompt_id="p1", prompt_type="T", prompt_text="Hello?", response_schema=RESPONSE_SCHEMA
+    )
+    errors = schema.validate_batch([{"sentiment": "positive"}, {}, {"sentiment": 1}])
+    assert [index for index, _ in errors] == [1, 2]
+    assert all(messages for _, messages in errors)
+
+
+def test_json_fields_check_top_level_type_only():
+    schema = PromptSchema(
+        prompt_id="p1",
+        prompt_type="T",
+        prompt_text="Hello?",
+        response_schema=RESPONSE_SCHEMA,
+        additional_messages=[{"role": "system", "content": "Be brief."}],
+    )
+    assert schema.additional_messages == [{"role": "system", "content": "Be brief."}]
+
+    with pytest.raises(ValidationError):
+        PromptSchema(
+            prompt_id="p1", prompt_type="T", prompt_text="Hello?", response_schema="{}"
+        )
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"provider_configs": {1: "x"}},
+        {"response_schema": {1: "x"}},
+        {"additional_messages": ["junk", 3]},
+        {"additional_messages": [{1: "system"}]},
+    ],
+)
+def test_json_fields_reject_non_string_keys_and_bad_messages(fields):
+    data = {
+        "prompt_id": "p1",
+        "prompt_type": "T",
+        "prompt_text": "Hello?",
+        "response_schema": RESPONSE_SCHEMA,
+        **fields,
+    }
+    with pytest.raises(ValidationError):
+        PromptSchema(**data)
+    with pytest.raises(ValidationError):
+        PromptSchemaUpdate(**fields)
+
+
+@pytest.mark.parametrize("prompt_id", ["", "has space", "trailing\n", "x" * 65])
+def test_invalid_prompt_id_rejected(prompt_id):
+    with pytest.raises(ValidationError):
+        PromptResponse(response_id="r1", prompt_id=prompt_id, raw_response={})
+
+
+def test_uuid_prompt_id_accepted():
+    prompt_id = "3f2b8c1e-9a4d-4e7b-8c2a-1d5e6f7a8b9c"
+    assert PromptResponse(response_id="r1", prompt_id=prompt_id, raw_response={}).prompt_id == prompt_id
+
+
+def test_supplied_schema_hash_cannot_poison_validator_cache():
+    strict_schema = {"type": "object", "required": ["a"]}
+    schema = PromptSchema(
+        prompt_id="p1",
+        prompt_type="T",
+        prompt_text="Hello?",
+        response_schema={"type": "object"},
+        schema_hash=hash_response_schema(strict_schema),
+    )
+    assert schema.schema_hash == hash_response_schema({"type": "object"})
+    assert schema.compiled_validator.is_valid({})
+
+    with pytest.raises(ValidationError):
+        PromptResponse.model_validate(
+            {"response_id": "r1", "prompt_id": "p1", "raw_response": {}},
+            context={"response_schema": strict_schema},
+        )
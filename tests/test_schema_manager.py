@@ -0,0 +1,402 @@
+import json
+import os
+import sys
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import event
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gemini_structured_response_prompts_database import PromptSchema, SchemaManager
+from gemini_structured_response_prompts_database.database import Database
+from gemini_structured_response_prompts_database.models import (
+    PromptResponseDB,
+    PromptSchemaDB,
+    hash_response_schema,
+)
+
+
+@pytest_asyncio.fixture
+async def manager():
+    database = Database(url="sqlite:///:memory:")
+    await database.connect()
+    try:
+        yield SchemaManager(database=database)
+    finally:
+        await database.disconnect()
+
+
+async def _seed(manager, prompt_id="test_prompt"):
+    await manager.database.create_schema(
+        PromptSchemaDB(
+            prompt_id=prompt_id,
+            prompt_title="Test",
+            main_prompt="Hello?",
+            response_schema={"type": "object"},
+        )
+    )
+
+
+def _without_returning(manager):
+    """Behave like SQLite < 3.35 and record the statements that are executed"""
+    engine = manager.database.engine.sync_engine
+    engine.dialect.update_returning = engine.dialect.insert_returning = False
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_get_prompt_schema(manager):
+    await _seed(manager)
+
+    schema = await manager.get_prompt_schema("test_prompt")
+    assert isinstance(schema, PromptSchema)
+    assert schema.prompt_title == "Test"
+    assert schema.main_prompt == "Hello?"
+
+
+@pytest.mark.asyncio
+async def test_get_prompt_schema_json(manager):
+    await _seed(manager)
+
+    encoded = json.loads(await manager.get_prompt_schema_json("test_prompt"))
+    assert encoded["prompt_id"] == "test_prompt"
+    assert encoded["response_schema"] == {"type": "object"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_and_get_prompt_schemas(manager):
+    created = await manager.bulk_create_prompt_schemas(
+        [
+            {
+                "prompt_id": f"prompt_{i}",
+                "prompt_type": f"Prompt {i}",
+                "prompt_text": "Hello?",
+                "response_schema": {"type": "object"},
+            }
+            for i in range(3)
+        ]
+    )
+    assert [schema.prompt_id for schema in created] == ["prompt_0", "prompt_1", "prompt_2"]
+
+    fetched = await manager.get_prompt_schemas(["prompt_2", "missing", "prompt_0"])
+    assert [schema.prompt_id for schema in fetched] == ["prompt_2", "prompt_0"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_keeps_imported_created_at(manager):
+    created = await manager.bulk_create_prompt_schemas(
+        [
+            {
+                "prompt_id": "imported",
+                "prompt_type": "Imported",
+                "prompt_text": "Hello?",
+                "response_schema": {"type": "object"},
+                "created_at": 1700000000,
+            },
+            {
+                "prompt_id": "fresh",
+                "prompt_type": "Fresh",
+                "prompt_text": "Hello?",
+                "response_schema": {"type": "object"},
+            },
+        ]
+    )
+    assert created[0].created_at == 1700000000
+    assert created[1].created_at > 1700000000
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_prompt_schemas_without_returning(manager):
+    statements = _without_returning(manager)
+
+    created = await manager.bulk_create_prompt_schemas(
+        [
+            {
+                "prompt_id": f"prompt_{i}",
+                "prompt_type": f"Prompt {i}",
+                "prompt_text": "Hello?",
+                "response_schema": {"type": "object"},
+            }
+            for i in (2, 0, 1)
+        ]
+    )
+    assert [schema.prompt_id for schema in created] == ["prompt_2", "prompt_0", "prompt_1"]
+    assert all(schema.created_at for schema in created)
+    assert not any("RETURNING" in statement for statement in statements)
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_prompt_schemas(manager):
+    await _seed(manager, "first")
+    await _seed(manager, "second")
+
+    updated = await manager.bulk_update_prompt_schemas(
+        [
+            {"prompt_id": "second", "prompt_text": "Updated?"},
+            {"prompt_id": "first", "model_instruction": "Be brief."},
+        ]
+    )
+    assert [schema.prompt_id for schema in updated] == ["second", "first"]
+    assert updated[0].main_prompt == "Updated?"
+    assert updated[1].model_instruction == "Be brief."
+    assert updated[1].main_prompt == "Hello?"
+    assert updated[1].last_updated is not None
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_unknown_id_writes_nothing(manager):
+    await _seed(manager, "first")
+    # Behave like asyncpg, which does not report executemany rowcounts
+    manager.database.engine.sync_engine.dialect.supports_sane_multi_rowcount = False
+
+    with pytest.raises(HTTPException) as exc_info:
+        await manager.bulk_update_prompt_schemas(
+            [
+                {"prompt_id": "first", "prompt_text": "Updated?"},
+                {"prompt_id": "missing", "prompt_text": "Updated?"},
+            ]
+        )
+    assert exc_info.value.status_code == 404
+    assert (await manager.get_prompt_schema("first")).main_prompt == "Hello?"
+
+
+@pytest.mark.asyncio
+async def test_validate_on_read(manager):
+    await manager.database.create_schema(
+        PromptSchemaDB(
+            prompt_id="valid",
+            prompt_title="Valid",
+            main_prompt="Hello?",
+            prompt_categories=["test"],
+            response_schema={"type": "object"},
+        )
+    )
+    await _seed(manager, "no_categories")
+    manager.validate_on_read = True
+
+    schema = await manager.get_prompt_schema("valid")
+    assert schema.prompt_categories == ["test"]
+    with pytest.raises(HTTPException):
+        await manager.get_prompt_schema("no_categories")
+
+
+@pytest.mark.asyncio
+async def test_update_prompt_schema_only_changes_given_fields(manager):
+    await _seed(manager)
+
+    updated = await manager.update_prompt_schema(
+        "test_prompt", prompt_text="Updated?", is_public=True
+    )
+    assert updated.main_prompt == "Updated?"
+    assert updated.is_public is True
+    assert updated.prompt_title == "Test"
+    assert updated.last_updated is not None
+
+
+@pytest.mark.asyncio
+async def test_update_prompt_schema_applies_keyword_fields(manager):
+    await _seed(manager)
+    await manager.update_prompt_schema("test_prompt", provider_configs={"gemini": {}})
+
+    updated = await manager.update_prompt_schema(
+        "test_prompt", created_by="me", provider_configs=None
+    )
+    assert updated.created_by == "me"
+    assert updated.provider_configs is None
+    assert updated.main_prompt == "Hello?"
+
+
+@pytest.mark.asyncio
+async def test_update_prompt_schema_rejects_unknown_field(manager):
+    await _seed(manager)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await manager.update_prompt_schema("test_prompt", bogus="x")
+    assert exc_info.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_update_prompt_schema_without_returning(manager):
+    await _seed(manager)
+    statements = _without_returning(manager)
+
+    updated = await manager.update_prompt_schema("test_prompt", prompt_text="Updated?")
+    assert updated.main_prompt == "Updated?"
+    assert updated.prompt_title == "Test"
+    assert not any("RETURNING" in statement for statement in statements)
+
+
+@pytest.mark.asyncio
+async def test_update_missing_prompt_schema(manager):
+    with pytest.raises(HTTPException) as exc_info:
+        await manager.update_prompt_schema("missing", prompt_text="Updated?")
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_responses_with_schema(manager):
+    await _seed(manager)
+    for i in range(2):
+        await manager.database.create_response(
+            PromptResponseDB(
+                response_id=f"response_{i}",
+                prompt_id="test_prompt",
+                raw_response={"index": i},
+            )
+        )
+
+    pairs = await manager.get_responses_with_schema(["test_prompt"])
+    assert sorted(response.response_id for response, _ in pairs) == [
+        "response_0",
+        "response_1",
+    ]
+    assert pairs[0][1] is pairs[1][1]
+    assert pairs[0][1].prompt_title == "Test"
+
+
+@pytest.mark.asyncio
+async def test_create_and_delete_prompt_schema(manager):
+    created = await manager.create_prompt_schema(
+        prompt_id="created",
+        prompt_title="Created",
+        prompt_text="Hello?",
+        response_schema={"type": "object"},
+    )
+    assert created.prompt_title == "Created"
+    assert created.main_prompt == "Hello?"
+
+    assert await manager.delete_prompt_schema("created") is True
+    assert await manager.get_prompt_schemas(["created"]) == []
+
+
+@pytest.mark.asyncio
+async def test_nested_non_string_keys_are_stringified(manager):
+    await manager.create_prompt_schema(
+        prompt_id="nested",
+        prompt_title="Nested",
+        prompt_text="Hello?",
+        response_schema={"type": "object"},
+        provider_configs={"gemini": {1: "x"}},
+    )
+    schema = await manager.get_prompt_schema("nested")
+    assert schema.provider_configs == {"gemini": {"1": "x"}}
+
+
+@pytest.mark.asyncio
+async def test_get_prompt_schema_is_cached_until_updated(manager):
+    await _seed(manager)
+
+    first = await manager.get_prompt_schema("test_prompt")
+    assert await manager.get_prompt_schema("test_prompt") is first
+
+    await manager.update_prompt_schema("test_prompt", prompt_text="Updated?")
+    updated = await manager.get_prompt_schema("test_prompt")
+    assert updated is not first
+    assert updated.main_prompt == "Updated?"
+
+    await manager.delete_prompt_schema("test_prompt")
+    with pytest.raises(HTTPException) as exc_info:
+        await manager.get_prompt_schema("test_prompt")
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_schema_cache_is_per_manager(manager):
+    await _seed(manager, "no_categories")
+    other = SchemaManager(database=manager.database)
+
+    cached = await manager.get_prompt_schema("no_categories")
+    assert await other.get_prompt_schema("no_categories") is not cached
+
+    manager.validate_on_read = True
+    with pytest.raises(HTTPException):
+        await manager.get_prompt_schema("no_categories")
+
+
+@pytest.mark.asyncio
+async def test_schema_hash_stored_on_write(manager):
+    created = await manager.create_prompt_schema(
+        prompt_id="hashed",
+        prompt_title="Hashed",
+        prompt_text="Hello?",
+        response_schema={"type": "object", "required": []},
+    )
+    assert created.schema_hash == hash_response_schema({"required": [], "type": "object"})
+
+    updated = await manager.update_prompt_schema(
+        "hashed", response_schema={"type": "array"}
+    )
+    assert updated.schema_hash == hash_response_schema({"type": "array"})
+
+
+@pytest.mark.asyncio
+async def test_unhashable_response_schema_rejected(manager):
+    with pytest.raises(HTTPException) as exc_info:
+        await manager.create_prompt_schema(
+            prompt_id="mixed",
+            prompt_title="Mixed",
+            prompt_text="Hello?",
+            response_schema={"properties": {1: {}, "a": {}}},
+        )
+    assert exc_info.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_prompt_schemas_fast(manager):
+    await _seed(manager, "private")
+    await manager.database.create_schema(
+        PromptSchemaDB(
+            prompt_id="public",
+            prompt_title="Public",
+            main_prompt="Hello?",
+            response_schema={"type": "object"},
+            is_public=True,
+        )
+    )
+
+    rows = await manager.list_prompt_schemas_fast({"is_public": True})
+    assert [row["prompt_id"] for row in rows] == ["public"]
+    assert rows[0]["response_schema"] == {"type": "object"}
+
+    assert len(await manager.list_prompt_schemas_fast()) == 2
+    with pytest.raises(HTTPException) as exc_info:
+        await manager.list_prompt_schemas_fast({"missing": 1})
+    assert exc_info.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_update_can_clear_optional_field(manager):
+    await _seed(manager, "first")
+    await manager.update_prompt_schema("first", model_instruction="Be brief.")
+
+    updated = await manager.bulk_update_prompt_schemas(
+        [{"prompt_id": "first", "model_instruction": None}]
+    )
+    assert updated[0].model_instruction is None
+    assert updated[0].main_prompt == "Hello?"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"prompt_text": None},
+        {"is_public": None, "prompt_categories": None},
+        {"bogus": "x"},
+        {"response_schema": {"properties": {1: {}, "a": {}}}},
+    ],
+)
+async def test_bulk_update_rejects_invalid_changes(manager, changes):
+    await _seed(manager)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await manager.bulk_update_prompt_schemas([{"prompt_id": "test_prompt", **changes}])
+    assert exc_info.value.status_code == 422
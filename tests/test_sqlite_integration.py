@@ -32,3 +32,20 @@ async def test_create_and_get_schema(db):
     assert fetched.prompt_id == "test_prompt"
 
 
+@pytest.mark.asyncio
+async def test_fast_construct_schema_is_persisted(db):
+    schema = PromptSchemaDB._fast_construct(
+        {
+            "prompt_id": "fast_prompt",
+            "prompt_title": "Fast",
+            "main_prompt": "Hello?",
+            "response_schema": {"type": "object"},
+            "unknown_key": "ignored",
+        }
+    )
+    await db.create_schema(schema)
+
+    fetched = await db.get_schema("fast_prompt")
+    assert fetched.prompt_title == "Fast"
+    assert fetched.is_public is False
+    assert fetched.created_at is not None